@@ -0,0 +1,284 @@
+import contextlib
+import multiprocessing
+import time
+
+import numpy as np
+
+# ==============================
+# Cost Function & Fitness
+# ==============================
+# Solutions are arrays of room indices, one slot per exam; exam student
+# counts and room capacities are aligned int32 arrays.
+def calculate_cost(schedule, exam_students, room_capacity, alpha, beta):
+    diff = room_capacity[schedule] - exam_students
+    capacity_violation = int(-np.minimum(diff, 0).sum())
+    wasted_capacity = int(np.maximum(diff, 0).sum())
+
+    total_cost = alpha * capacity_violation + beta * wasted_capacity
+    return total_cost, capacity_violation, wasted_capacity
+
+
+def exam_room_costs(exam_students, room_capacity, alpha, beta):
+    # The cost is a sum of per-exam terms, so each (exam, room) pair's
+    # weighted violation/waste can be tabulated once per run
+    diff = room_capacity[None, :] - exam_students[:, None]
+    return np.where(diff < 0, -alpha * diff, beta * diff)
+
+
+def calculate_cost_batch(population, cost_table):
+    # Works on a single schedule or a (colony_size, num_exams) population
+    exams = np.arange(cost_table.shape[0])
+    return cost_table[exams, population].sum(axis=-1)
+
+
+def fitness(cost):
+    return 1 / (1 + cost)
+
+# ==============================
+# ABC Helper Functions
+# ==============================
+def room_index_dtype(num_rooms):
+    # Smallest unsigned type that holds every room index (uint8 for <= 256 rooms)
+    return np.min_scalar_type(num_rooms - 1)
+
+
+def generate_population(rng, size, num_exams, num_rooms):
+    return rng.integers(
+        0, num_rooms, size=(size, num_exams), dtype=room_index_dtype(num_rooms)
+    )
+
+
+def feasible_rooms(exam_students, room_capacity, closest_rooms):
+    # Candidate room lists in CSR form (flat rooms, offsets, counts): list e
+    # holds the smallest rooms that fit exam e, list num_exams + e every room
+    # that fits it; exams that fit nowhere get their closest-capacity room
+    fits = room_capacity[None, :] >= exam_students[:, None]
+    unplaceable = ~fits.any(axis=1)
+    fits[unplaceable, closest_rooms[unplaceable]] = True
+    smallest = np.where(fits, room_capacity[None, :], np.inf).min(axis=1)
+    best_fit = fits & (room_capacity[None, :] == smallest[:, None])
+
+    masks = np.vstack([best_fit, fits])
+    counts = masks.sum(axis=1)
+    offsets = np.cumsum(counts) - counts
+    rooms = np.nonzero(masks)[1].astype(closest_rooms.dtype)
+    return rooms, offsets, counts
+
+
+def generate_seeded_population(rng, size, candidates):
+    # Greedy best-fit start: each exam gets a smallest room that still fits it
+    # (random among equal capacities), or 10% of the time any room that fits
+    rooms, offsets, counts = candidates
+    num_exams = len(counts) // 2
+    lists = np.arange(num_exams) + num_exams * (rng.random((size, num_exams)) >= 0.9)
+    picks = (rng.random((size, num_exams)) * counts[lists]).astype(np.intp)
+    return rooms[offsets[lists] + picks]
+
+
+def closest_room_per_exam(exam_students, room_capacity):
+    # Room whose capacity is nearest each exam's size (first one on ties)
+    return np.abs(
+        room_capacity[None, :] - exam_students[:, None]
+    ).argmin(axis=1).astype(room_index_dtype(len(room_capacity)))
+
+
+def neighbor_moves(size, num_exams, closest_rooms, num_rooms, rng):
+    # (exam, new room) moves of the given shape; food sources are not copied
+    exams = rng.integers(0, num_exams, size=size, dtype=np.min_scalar_type(num_exams - 1))
+
+    # Encourage exploration (allow violations)
+    explore = rng.random(size) < 0.8
+    random_rooms = rng.integers(0, num_rooms, size=size, dtype=closest_rooms.dtype)
+
+    return exams, np.where(explore, random_rooms, closest_rooms[exams])
+
+
+def delta_cost(cost_table, exams, old_rooms, new_rooms):
+    # Moving an exam only changes that exam's term of the cost
+    return cost_table[exams, new_rooms] - cost_table[exams, old_rooms]
+
+
+def apply_moves(food_sources, cost_values, trials, sources, exams, new_rooms, cost_table):
+    # Same outcome as trying the moves one after another, keeping each one
+    # that lowers its source's cost. The cost is a sum of per-exam terms, so
+    # only repeats of a (source, exam) pair depend on each other; they are
+    # applied in rounds by their order of occurrence.
+    num_moves = len(sources)
+    position = np.arange(num_moves)
+    keys = sources * food_sources.shape[1] + exams
+    order = np.argsort(keys, kind="stable")
+    group_starts = np.flatnonzero(np.r_[True, keys[order][1:] != keys[order][:-1]])
+    rank = np.empty(num_moves, dtype=np.intp)
+    rank[order] = position - np.repeat(group_starts, np.diff(np.r_[group_starts, num_moves]))
+
+    accepted = np.zeros(num_moves, dtype=bool)
+    for r in range(rank.max() + 1):
+        moves = np.flatnonzero(rank == r)
+        src, exm, new = sources[moves], exams[moves], new_rooms[moves]
+        deltas = delta_cost(cost_table, exm, food_sources[src, exm], new)
+        better = deltas < 0
+        food_sources[src[better], exm[better]] = new[better]
+        np.add.at(cost_values, src[better], deltas[better])
+        accepted[moves[better]] = True
+
+    # A source's trial counter restarts at its last accepted move and grows
+    # with every rejected move after that
+    last_accept = np.full(len(trials), -1)
+    np.maximum.at(last_accept, sources[accepted], position[accepted])
+    late_rejects = ~accepted & (position > last_accept[sources])
+    rejected = np.bincount(sources[late_rejects], minlength=len(trials))
+    trials[:] = np.where(last_accept >= 0, rejected, trials + rejected)
+
+# ==============================
+# Artificial Bee Colony Algorithm
+# ==============================
+def artificial_bee_colony(exam_students, room_capacity, colony_size, max_cycles,
+                          scout_limit, alpha, beta, patience=0, tol=0.0, seed=None,
+                          migration=None):
+    start_time = time.time()
+    rng = np.random.default_rng(seed)
+    num_exams, num_rooms = len(exam_students), len(room_capacity)
+    closest_rooms = closest_room_per_exam(exam_students, room_capacity)
+    cost_table = exam_room_costs(exam_students, room_capacity, alpha, beta)
+    candidates = feasible_rooms(exam_students, room_capacity, closest_rooms)
+
+    # Population matrix: one row of room indices per food source; most rows
+    # start from a perturbed best-fit assignment, the rest stay uniform random
+    # for exploration
+    n_seeded = int(0.8 * colony_size)
+    food_sources = np.vstack([
+        generate_seeded_population(rng, n_seeded, candidates),
+        generate_population(rng, colony_size - n_seeded, num_exams, num_rooms),
+    ])
+    trials = np.zeros(colony_size, dtype=np.int32)
+    rows = np.arange(colony_size)
+
+    # Random draws for every employed/onlooker move and roulette spin are made
+    # up front, one Generator call each, and read per cycle by index
+    # (move rows: employed moves first, then onlooker moves)
+    move_exams, move_rooms = neighbor_moves(
+        (max_cycles, 2, colony_size), num_exams, closest_rooms, num_rooms, rng
+    )
+    roulette = rng.random((max_cycles, colony_size))
+
+    # Cached per-source costs, refreshed only when a source changes
+    cost_values = calculate_cost_batch(food_sources, cost_table)
+
+    best_solution = None
+    best_cost = float("inf")
+    convergence = np.empty(max_cycles, dtype=np.float64)
+    collapsed = 0
+    upstream_open = migration is not None
+
+    for cycle in range(max_cycles):
+
+        # Employed + Onlooker Bees Phases, fused into one pass: every source
+        # gets one employed move, then colony_size onlooker moves go to
+        # roulette picks weighted by the cycle's starting fitness
+        cumprob = np.cumsum(fitness(cost_values))
+        picks = np.searchsorted(cumprob, roulette[cycle] * cumprob[-1])
+        sources = np.concatenate([rows, np.minimum(picks, colony_size - 1)])
+
+        apply_moves(
+            food_sources, cost_values, trials, sources,
+            move_exams[cycle].ravel(), move_rooms[cycle].ravel(), cost_table
+        )
+
+        # Scout Bees Phase (the current best source is never abandoned)
+        exhausted = trials > scout_limit
+        exhausted[cost_values.argmin()] = False
+        food_sources[exhausted] = generate_seeded_population(rng, exhausted.sum(), candidates)
+        cost_values[exhausted] = calculate_cost_batch(food_sources[exhausted], cost_table)
+        trials[exhausted] = 0
+
+        # Update Best Solution
+        best_index = int(cost_values.argmin())
+        if cost_values[best_index] < best_cost:
+            best_cost = cost_values[best_index]
+            best_solution = food_sources[best_index].copy()
+
+        # Migration: send the best to the next colony in the ring, then wait
+        # for the previous colony's migrant of this same cycle, so a seeded
+        # run does not depend on process timing. The migrant replaces this
+        # colony's worst food source if it is better; None means the
+        # previous colony has stopped and no more migrants will come.
+        if upstream_open and (cycle + 1) % migration[0] == 0:
+            _, inbox, outbox = migration
+            outbox.put(best_solution)
+            migrant = inbox.get()
+            if migrant is None:
+                upstream_open = False
+            else:
+                migrant_cost = calculate_cost_batch(migrant, cost_table)
+                worst = int(cost_values.argmax())
+                if migrant_cost < cost_values[worst]:
+                    food_sources[worst] = migrant
+                    cost_values[worst] = migrant_cost
+                    trials[worst] = 0
+
+        convergence[cycle] = best_cost
+
+        # Cycles in which every food source has collapsed onto the best cost
+        collapsed = collapsed + 1 if (cost_values == best_cost).all() else 0
+
+        # Early exit: a zero-cost schedule cannot be improved. After a warm-up
+        # of max_cycles // 10, stop when the best cost moved by at most tol
+        # (relative) over the last `patience` cycles, or the colony has had
+        # no diversity for that long (patience 0 = never)
+        if best_cost == 0:
+            convergence = convergence[:cycle + 1]
+            break
+        if patience and cycle >= max(patience, max_cycles // 10):
+            previous = convergence[cycle - patience]
+            stalled = abs(best_cost - previous) <= tol * (best_cost + previous + 1e-9)
+            if stalled or collapsed >= patience:
+                convergence = convergence[:cycle + 1]
+                break
+
+    # Tell the next colony in the ring not to wait for further migrants
+    if migration is not None:
+        migration[2].put(None)
+
+    elapsed_time = time.time() - start_time
+    return best_solution, best_cost, convergence, elapsed_time
+
+# ==============================
+# Multi-Colony (Parallel) ABC
+# ==============================
+def run_colonies(n_colonies, exam_students, room_capacity, colony_size, max_cycles,
+                 scout_limit, alpha, beta, patience=0, tol=0.0, seed=None,
+                 migration_interval=0):
+    if n_colonies == 1:
+        return artificial_bee_colony(
+            exam_students, room_capacity, colony_size, max_cycles,
+            scout_limit, alpha, beta, patience, tol, seed
+        )
+
+    start_time = time.time()
+    seeds = np.random.SeedSequence(seed).spawn(n_colonies)
+    ctx = multiprocessing.get_context("spawn")
+
+    # Queues for ring migration live in a manager process so pool workers can share them
+    manager_ctx = ctx.Manager() if migration_interval > 0 else contextlib.nullcontext()
+
+    with manager_ctx as manager:
+        migrations = [None] * n_colonies
+        if manager is not None:
+            queues = [manager.Queue() for _ in range(n_colonies)]
+            migrations = [
+                (migration_interval, queues[k], queues[(k + 1) % n_colonies])
+                for k in range(n_colonies)
+            ]
+
+        # One colony per worker: migrating colonies wait on each other, so
+        # all of them must run at once
+        with ctx.Pool(n_colonies) as pool:
+            results = pool.starmap(artificial_bee_colony, [
+                (exam_students, room_capacity, colony_size, max_cycles,
+                 scout_limit, alpha, beta, patience, tol, seeds[k], migrations[k])
+                for k in range(n_colonies)
+            ], chunksize=1)
+
+    best_solution, best_cost, convergence, _ = min(results, key=lambda r: r[1])
+    elapsed_time = time.time() - start_time
+    return best_solution, best_cost, convergence, elapsed_time
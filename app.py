@@ -1,11 +1,10 @@
 import streamlit as st
 import pandas as pd
-import random
 import numpy as np
-import time
-import matplotlib.pyplot as plt
 import os
 
+from abc_core import calculate_cost, run_colonies
+
 # ==============================
 # Page Configuration
 # ==============================
@@ -24,135 +23,38 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 exam_file = os.path.join(BASE_DIR, "exam_timeslot.csv")
 room_file = os.path.join(BASE_DIR, "classrooms.csv")
 
+@st.cache_data
+def load_arrays(exam_path, room_path, mtimes):
+    # mtimes is part of the cache key so edited CSVs are picked up
+    exams = pd.read_csv(exam_path)
+    rooms = pd.read_csv(room_path)
+
+    # Normalize columns
+    exams.columns = exams.columns.str.lower()
+    rooms.columns = rooms.columns.str.lower()
+
+    return (
+        exams["exam_id"].to_numpy(),
+        exams["course_code"].to_numpy(),
+        exams["num_students"].to_numpy(np.int32),
+        exams["exam_day"].to_numpy(),
+        exams["exam_time"].to_numpy(),
+        rooms["classroom_id"].to_numpy(),
+        rooms["capacity"].to_numpy(np.int32),
+        rooms["room_type"].to_numpy(),
+    )
+
+
 if os.path.exists(exam_file) and os.path.exists(room_file):
-    exams = pd.read_csv(exam_file)
-    rooms = pd.read_csv(room_file)
+    (exam_ids, course_codes, exam_stu_arr, exam_days, exam_times,
+     room_ids, room_cap_arr, room_types) = load_arrays(
+        exam_file, room_file, (os.path.getmtime(exam_file), os.path.getmtime(room_file))
+    )
     st.success("Datasets loaded successfully!")
 else:
     st.error("Exam or classroom dataset not found.")
     st.stop()
 
-# Normalize columns
-exams.columns = exams.columns.str.lower()
-rooms.columns = rooms.columns.str.lower()
-
-# ==============================
-# Prepare Data
-# ==============================
-exam_ids = exams["exam_id"].tolist()
-room_ids = rooms["classroom_id"].tolist()
-
-num_students = dict(zip(exams["exam_id"], exams["num_students"]))
-room_capacity = dict(zip(rooms["classroom_id"], rooms["capacity"]))
-course_code = dict(zip(exams["exam_id"], exams["course_code"]))
-
-# ==============================
-# Cost Function & Fitness
-# ==============================
-def calculate_cost(schedule, alpha, beta):
-    capacity_violation = 0
-    wasted_capacity = 0
-
-    for exam, room in schedule.items():
-        students = num_students[exam]
-        capacity = room_capacity[room]
-
-        if students > capacity:
-            capacity_violation += (students - capacity)
-        else:
-            wasted_capacity += (capacity - students)
-
-    total_cost = alpha * capacity_violation + beta * wasted_capacity
-    return total_cost, capacity_violation, wasted_capacity
-
-
-def fitness(schedule, alpha, beta):
-    cost, _, _ = calculate_cost(schedule, alpha, beta)
-    return 1 / (1 + cost)
-
-# ==============================
-# ABC Helper Functions
-# ==============================
-def generate_solution():
-    return {exam: random.choice(room_ids) for exam in exam_ids}
-
-
-def neighbor_solution(solution):
-    new_solution = solution.copy()
-    exam = random.choice(exam_ids)
-
-    # Encourage exploration (allow violations)
-    if random.random() < 0.8:
-        new_solution[exam] = random.choice(room_ids)
-    else:
-        room_options = sorted(
-            room_ids,
-            key=lambda r: abs(room_capacity[r] - num_students[exam])
-        )
-        new_solution[exam] = room_options[0]
-
-    return new_solution
-
-# ==============================
-# Artificial Bee Colony Algorithm
-# ==============================
-def artificial_bee_colony(colony_size, max_cycles, scout_limit, alpha, beta):
-    start_time = time.time()
-
-    food_sources = [generate_solution() for _ in range(colony_size)]
-    trials = [0] * colony_size
-
-    best_solution = None
-    best_cost = float("inf")
-    convergence = []
-
-    for cycle in range(max_cycles):
-
-        # Employed Bees Phase
-        for i in range(colony_size):
-            candidate = neighbor_solution(food_sources[i])
-            if fitness(candidate, alpha, beta) > fitness(food_sources[i], alpha, beta):
-                food_sources[i] = candidate
-                trials[i] = 0
-            else:
-                trials[i] += 1
-
-        # Onlooker Bees Phase
-        probabilities = [fitness(sol, alpha, beta) for sol in food_sources]
-        total_prob = sum(probabilities)
-
-        for _ in range(colony_size):
-            r = random.uniform(0, total_prob)
-            acc = 0
-            for i, prob in enumerate(probabilities):
-                acc += prob
-                if acc >= r:
-                    candidate = neighbor_solution(food_sources[i])
-                    if fitness(candidate, alpha, beta) > fitness(food_sources[i], alpha, beta):
-                        food_sources[i] = candidate
-                        trials[i] = 0
-                    else:
-                        trials[i] += 1
-                    break
-
-        # Scout Bees Phase
-        for i in range(colony_size):
-            if trials[i] > scout_limit:
-                food_sources[i] = generate_solution()
-                trials[i] = 0
-
-        # Update Best Solution
-        for sol in food_sources:
-            cost, _, _ = calculate_cost(sol, alpha, beta)
-            if cost < best_cost:
-                best_cost = cost
-                best_solution = sol
-
-        convergence.append(best_cost)
-
-    elapsed_time = time.time() - start_time
-    return best_solution, best_cost, convergence, elapsed_time
-
 # ==============================
 # Sidebar Parameters
 # ==============================
@@ -166,23 +68,41 @@ st.sidebar.markdown("### Objective Weights")
 alpha = st.sidebar.slider("Capacity Violation Weight (α)", 10, 100, 50)
 beta = st.sidebar.slider("Wasted Capacity Weight (β)", 1, 20, 5)
 
+st.sidebar.markdown("### Early Stopping")
+patience = st.sidebar.slider("Patience (0 = off)", 0, 100, 0, 5)
+tol = st.sidebar.select_slider(
+    "Relative Tolerance", options=[0.0, 1e-5, 1e-4, 1e-3, 1e-2], value=1e-5,
+    disabled=patience == 0
+)
+
 # Reproducible option
 reproducible = st.sidebar.checkbox("Reproducible Run (Fix Random Seed)", value=False)
+seed = None
 if reproducible:
-    seed = st.sidebar.number_input("Random Seed", value=42, step=1)
-    random.seed(seed)
-    np.random.seed(seed)
+    seed = int(st.sidebar.number_input("Random Seed", value=42, step=1))
+
+st.sidebar.markdown("### Parallel Colonies")
+n_colonies = st.sidebar.slider("Independent Colonies", 1, max(os.cpu_count() or 1, 2), 1)
+migration_interval = st.sidebar.slider(
+    "Migration Interval (0 = off)", 0, 50, 0, 5, disabled=n_colonies == 1
+)
 
 # ==============================
 # Run ABC
 # ==============================
 if st.button("🚀 Run ABC Optimization"):
     with st.spinner("Running Artificial Bee Colony..."):
-        best_solution, best_cost, history, elapsed = artificial_bee_colony(
-            colony_size, max_iteration, scout_limit, alpha, beta
+        best_solution, best_cost, history, elapsed = run_colonies(
+            n_colonies, exam_stu_arr, room_cap_arr, colony_size, max_iteration,
+            scout_limit, alpha, beta, patience, tol, seed, migration_interval
         )
 
-    cost, cap_violations, wasted = calculate_cost(best_solution, alpha, beta)
+    if len(history) < max_iteration:
+        st.info(f"Stopped early after {len(history)} of {max_iteration} iterations.")
+
+    cost, cap_violations, wasted = calculate_cost(
+        best_solution, exam_stu_arr, room_cap_arr, alpha, beta
+    )
 
     # ==============================
     # Metrics
@@ -199,27 +119,24 @@ if st.button("🚀 Run ABC Optimization"):
     # Convergence Curve
     # ==============================
     st.subheader("📈 ABC Convergence Curve")
-    fig, ax = plt.subplots()
-    ax.plot(history)
-    ax.set_xlabel("Iteration")
-    ax.set_ylabel("Best Cost")
-    ax.set_title("ABC Convergence Curve")
-    st.pyplot(fig)
+    st.line_chart(
+        pd.Series(history, name="Best Cost"), x_label="Iteration", y_label="Best Cost"
+    )
 
     # ==============================
     # Final Schedule
     # ==============================
     st.subheader("🗓️ Optimized Exam Schedule")
-    result_df = pd.DataFrame([
-        {
-            "Exam ID": e,
-            "Course Code": course_code[e],
-            "Students": num_students[e],
-            "Classroom": r,
-            "Room Capacity": room_capacity[r]
-        }
-        for e, r in best_solution.items()
-    ])
+    result_df = pd.DataFrame({
+        "Exam ID": exam_ids,
+        "Course Code": course_codes,
+        "Students": exam_stu_arr,
+        "Exam Day": exam_days,
+        "Exam Time": exam_times,
+        "Classroom": room_ids[best_solution],
+        "Room Type": room_types[best_solution],
+        "Room Capacity": room_cap_arr[best_solution]
+    })
     st.dataframe(result_df, use_container_width=True)
 
 # ==============================